@@ -1,7 +1,13 @@
 import os
-import json
 import time
+import atexit
+import hashlib
+import mmap
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import fitz  # PyMuPDF
+import httpx
+import orjson
 from openai import OpenAI, RateLimitError
 import re
 from dotenv import load_dotenv
@@ -19,37 +25,157 @@ if not HF_TOKEN:
     print("ERROR: HF_TOKEN environment variable not set.", file=sys.stderr)
     sys.exit(1)
 
+# One keep-alive connection pool for every LLM call, so each request reuses
+# the TLS session to the router instead of paying a fresh TCP+TLS handshake.
+# HTTP/2 multiplexing needs the optional h2 package; fall back to HTTP/1.1
+# keep-alive when it isn't installed.
+_http_limits = httpx.Limits(max_keepalive_connections=16, max_connections=32)
+try:
+    _http_client = httpx.Client(http2=True, timeout=60.0, limits=_http_limits)
+except ImportError:
+    _http_client = httpx.Client(timeout=60.0, limits=_http_limits)
+atexit.register(_http_client.close)
+
 client = OpenAI(
     base_url="https://router.huggingface.co/v1",
     api_key=HF_TOKEN,
-    timeout=60.0
+    timeout=60.0,
+    http_client=_http_client
 )
 
 os.makedirs(INPUT_FOLDER, exist_ok=True)
 os.makedirs(OUTPUT_FOLDER, exist_ok=True)
 
+# How many PDFs to process at once when several are passed on the CLI.
+MAX_WORKERS = 4
+
+# Proactive throttle so concurrent workers don't race into 429s: LLM calls
+# are spaced at least _llm_interval seconds apart across all threads.
+LLM_REQUESTS_PER_MIN = int(os.environ.get("LLM_REQUESTS_PER_MIN", "30"))
+_llm_interval = 60.0 / LLM_REQUESTS_PER_MIN
+_llm_lock = threading.Lock()
+_llm_next_call = 0.0
+
+
+def _throttle_llm():
+    """Blocks until this thread is allowed to issue the next LLM call."""
+    global _llm_next_call
+    with _llm_lock:
+        now = time.monotonic()
+        wait = _llm_next_call - now
+        _llm_next_call = max(now, _llm_next_call) + _llm_interval
+    if wait > 0:
+        time.sleep(wait)
+
+
+def _widen_llm_throttle():
+    """Doubles the spacing between LLM calls after a rate-limit response."""
+    global _llm_interval
+    with _llm_lock:
+        _llm_interval = min(_llm_interval * 2, 60.0)
+
 
 # --- Helper Functions ---
+_SANITIZE_RE = re.compile(r'[^\w\-]+')
+
+
 def sanitize_filename(filename):
-    filename = filename.replace(" ", "_")
-    filename = re.sub(r'[^\w\-]', '', filename)
-    return filename[:100]
+    return _SANITIZE_RE.sub('', filename.replace(" ", "_"))[:100]
+
+
+# Page extraction is CPU-bound; fan out across processes only for long PDFs
+# where the speedup outweighs the process-spawn overhead.
+PARALLEL_PAGE_THRESHOLD = 8
+
+
+def _open_pdf(pdf_path):
+    """
+    Opens a PDF through an mmap'd view so page bytes are served straight from
+    the kernel page cache instead of being copied into the Python heap.
+    Falls back to PyMuPDF's own buffered reads where mmap isn't usable.
+    """
+    try:
+        with open(pdf_path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        # PyMuPDF doesn't accept mmap objects directly; a memoryview keeps
+        # the access zero-copy.
+        return fitz.open(stream=memoryview(mm), filetype="pdf")
+    except (OSError, TypeError, ValueError):
+        return fitz.open(pdf_path)
+
+
+def _extract_page(pdf_path, page_number):
+    """Extracts one page's text; each worker opens its own document handle."""
+    doc = _open_pdf(pdf_path)
+    try:
+        return doc.load_page(page_number).get_text("text")
+    finally:
+        doc.close()
 
 
 def extract_text_from_pdf(pdf_path):
     try:
-        doc = fitz.open(pdf_path)
-        text = "".join([page.get_text() for page in doc])
+        doc = _open_pdf(pdf_path)
+        page_count = doc.page_count
+        if page_count < PARALLEL_PAGE_THRESHOLD:
+            # "text" flavor skips block layout reconstruction; join once
+            # instead of building intermediate strings.
+            text = "".join(page.get_text("text") for page in doc)
+            doc.close()
+            return text
+
         doc.close()
-        return text
+        workers = min(page_count, max(1, (os.cpu_count() or 2) - 1))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pages = pool.map(_extract_page, [pdf_path] * page_count, range(page_count))
+            return "".join(pages)
     except Exception as e:
         print(f"Error extracting text from {pdf_path}: {e}", file=sys.stderr)
         return None
 
+# Parsed LLM responses keyed by normalized JD text, so re-submitting a JD
+# that differs only in whitespace/casing skips the model call entirely.
+LLM_CACHE_DIR = os.path.join(OUTPUT_FOLDER, ".llm_cache")
+
+
+def _llm_cache_path(text):
+    normalized = " ".join(text.lower().split())
+    key = hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+    return os.path.join(LLM_CACHE_DIR, f"{key}.json")
+
+
+def _llm_cache_get(text):
+    try:
+        with open(_llm_cache_path(text), "rb") as f:
+            return orjson.loads(f.read())
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"Error reading LLM cache: {e}", file=sys.stderr)
+        return None
+
+
+def _llm_cache_put(text, parsed):
+    try:
+        os.makedirs(LLM_CACHE_DIR, exist_ok=True)
+        with open(_llm_cache_path(text), "wb") as f:
+            f.write(orjson.dumps(parsed))
+    except Exception as e:
+        print(f"Error writing LLM cache: {e}", file=sys.stderr)
+
+
+# The parsing prompt is static for the lifetime of the process; read it once.
+_prompt_cache = None
+
+
 def load_prompt():
+    global _prompt_cache
+    if _prompt_cache is not None:
+        return _prompt_cache
     try:
         with open(PROMPT_FILE, "r", encoding="utf-8") as f:
-            return f.read()
+            _prompt_cache = f.read()
+        return _prompt_cache
     except Exception as e:
         print(f"Error reading prompt file: {e}", file=sys.stderr)
         return None
@@ -57,20 +183,34 @@ def load_prompt():
 def parse_job_description_with_llm(text, prompt, retries=5):
     if not text or not prompt:
         return None
-    full_prompt = f"{prompt}\n\n---\nJob Description:\n{text}\n---\nJSON Output:"
+
+    cached = _llm_cache_get(text)
+    if cached is not None:
+        print("LLM cache hit; skipping model call.", file=sys.stderr)
+        return cached
+
+    # Keep the static instructions in the system message and only the JD in
+    # the user message, so the provider can reuse its KV cache for the
+    # identical prefix across calls. Long PDFs are truncated: trailing legal
+    # footers carry no parse signal and only add prompt tokens.
+    user_prompt = f"Job Description:\n{text[:MAX_JD_CHARS]}\n\nJSON Output:"
     delay = 1
     for attempt in range(retries):
         try:
+            _throttle_llm()
             res = client.chat.completions.create(
                 model=LLM_MODEL,
                 messages=[
-                    {"role": "system", "content": "You are a helpful assistant designed to output JSON."},
-                    {"role": "user", "content": full_prompt}
+                    {"role": "system", "content": prompt},
+                    {"role": "user", "content": user_prompt}
                 ],
                 response_format={"type": "json_object"}
             )
-            return json.loads(res.choices[0].message.content)
+            parsed = orjson.loads(res.choices[0].message.content)
+            _llm_cache_put(text, parsed)
+            return parsed
         except RateLimitError:
+            _widen_llm_throttle()
             print(f"Rate limit exceeded. Retrying in {delay} seconds...", file=sys.stderr)
             time.sleep(delay)
             delay *= 2
@@ -79,6 +219,22 @@ def parse_job_description_with_llm(text, prompt, retries=5):
             return None
     return None
 
+# Cap on JD characters sent to the model (~6K tokens).
+MAX_JD_CHARS = 24000
+
+# Minimum word count and at least one of these markers before a JD is worth
+# an LLM call; anything below is a scan artifact or boilerplate page.
+MIN_JD_WORDS = 50
+JD_KEYWORDS = ("responsibilit", "requirement", "skill")
+
+
+def looks_like_job_description(text):
+    if len(text.split()) < MIN_JD_WORDS:
+        return False
+    lowered = text.lower()
+    return any(kw in lowered for kw in JD_KEYWORDS)
+
+
 def process_job_description(pdf_path):
     print(f"Extracting text from {pdf_path}...")
     job_text = extract_text_from_pdf(pdf_path)
@@ -86,6 +242,10 @@ def process_job_description(pdf_path):
         print(f"Could not extract text from {pdf_path}. Skipping.")
         return
 
+    if not looks_like_job_description(job_text):
+        print(f"Text from {pdf_path} is too short or has no job-description markers. Skipping LLM call.")
+        return None
+
     print("Loading parsing prompt...")
     parsing_prompt = load_prompt()
     if not parsing_prompt:
@@ -100,10 +260,10 @@ def process_job_description(pdf_path):
         out_file = os.path.join(OUTPUT_FOLDER, f"{base_name}.json")
         try:
 
-            with open(output_filename, "w", encoding="utf-8") as f:
-                json.dump(structured_profile, f, indent=4, ensure_ascii=False)
-            print(f"✅ Successfully created structured job profile: {output_filename}")
-            return output_filename
+            with open(out_file, "wb") as f:
+                f.write(orjson.dumps(structured_profile, option=orjson.OPT_INDENT_2))
+            print(f"✅ Successfully created structured job profile: {out_file}")
+            return out_file
 
         except Exception as e:
             print(f"Error saving JSON file {out_file}: {e}", file=sys.stderr)
@@ -117,18 +277,29 @@ def process_job_description(pdf_path):
 if __name__ == "__main__":
 
     if len(sys.argv) < 2:
-        print("Usage: python jdParsing.py <path_to_pdf>")
+        print("Usage: python jdParsing.py <path_to_pdf> [<path_to_pdf> ...]")
         sys.exit(1)
 
-    pdf_path = sys.argv[1]
-    if not os.path.exists(pdf_path):
-        print(f"Error: File not found at {pdf_path}")
-        sys.exit(1)
+    pdf_paths = sys.argv[1:]
+    for pdf_path in pdf_paths:
+        if not os.path.exists(pdf_path):
+            print(f"Error: File not found at {pdf_path}")
+            sys.exit(1)
 
-    output_file = process_job_description(pdf_path)
-    if output_file:
-        print(output_file)
-        sys.exit(0)
-    else:
-        sys.exit(1)
+    if len(pdf_paths) == 1:
+        output_file = process_job_description(pdf_paths[0])
+        if output_file:
+            print(output_file)
+            sys.exit(0)
+        else:
+            sys.exit(1)
+
+    # Several PDFs: overlap text extraction with the LLM round-trips.
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        output_files = list(executor.map(process_job_description, pdf_paths))
+
+    for output_file in output_files:
+        if output_file:
+            print(output_file)
+    sys.exit(0 if all(output_files) else 1)
 
@@ -1,11 +1,13 @@
 import os
-import time
-import json
+import orjson
 import subprocess
+import threading
 from dataclasses import dataclass, field
 from pymongo import MongoClient
 from dotenv import load_dotenv
 from langgraph.graph import StateGraph, START, END
+from watchdog.observers import Observer
+from watchdog.events import FileSystemEventHandler
 
 # Load .env file
 load_dotenv()
@@ -35,23 +37,50 @@ def latest_file(folder: str, exclude_list: list):
     
     return max(new_files, key=os.path.getctime) if new_files else None
 
+class _InputFolderHandler(FileSystemEventHandler):
+    """Wakes the waiting node when a file lands in the watched folder."""
+    def __init__(self, wakeup: threading.Event):
+        self._wakeup = wakeup
+
+    def on_closed(self, event):
+        # inotify IN_CLOSE_WRITE on Linux: fires once the writer is done.
+        if not event.is_directory:
+            self._wakeup.set()
+
+    def on_created(self, event):
+        # Fallback for platforms where close events are not emitted.
+        if not event.is_directory:
+            self._wakeup.set()
+
 # ---------- Node functions ----------
 def wait_for_input(state: AgentState) -> AgentState:
     """
     Waits for a new job description file to appear in the 'input' folder.
-    This node polls the directory and transitions only when a new file is found.
+    This node blocks on filesystem events instead of polling and transitions
+    only when a new file is found.
     """
     print("Node: Waiting for a new job description in 'input' folder...")
-    while True:
-        new_jd_file = latest_file("input", state.processed_files)
-        if new_jd_file:
-            print(f"New job description found: '{new_jd_file}'")
-            state.processed_files.append(new_jd_file)
-            state.current_jd_path = new_jd_file
-            return state
-        
-        print("No new files found. Checking again in 10s...")
-        time.sleep(10)
+    os.makedirs("input", exist_ok=True)
+    wakeup = threading.Event()
+    observer = Observer()
+    observer.schedule(_InputFolderHandler(wakeup), "input")
+    observer.start()
+    try:
+        while True:
+            # Scan before sleeping so files that arrived before (or while)
+            # the observer started are not missed.
+            new_jd_file = latest_file("input", state.processed_files)
+            if new_jd_file:
+                print(f"New job description found: '{new_jd_file}'")
+                state.processed_files.append(new_jd_file)
+                state.current_jd_path = new_jd_file
+                return state
+
+            wakeup.wait()
+            wakeup.clear()
+    finally:
+        observer.stop()
+        observer.join()
 
 def parse_jd(state: AgentState) -> AgentState:
     """Parses the latest job description file to extract the job title."""
@@ -64,8 +93,8 @@ def parse_jd(state: AgentState) -> AgentState:
         output_file_path = result.stdout.strip()
         if output_file_path and os.path.exists(output_file_path):
             state.current_output_path = output_file_path
-            with open(output_file_path, "r") as f:
-                data = json.load(f)
+            with open(output_file_path, "rb") as f:
+                data = orjson.loads(f.read())
             state.jobtitle = data.get("title", "")
             print(f"Job title found: '{state.jobtitle}'")
             state.approved = False
@@ -76,7 +105,7 @@ def parse_jd(state: AgentState) -> AgentState:
         print(f"Stderr: {e.stderr}")
     except FileNotFoundError:
         print(f"Error: jdParsing.py or the input file not found.")
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         print(f"Error: Could not decode JSON from the output file.")
     return state
 
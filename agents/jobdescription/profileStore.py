@@ -1,6 +1,6 @@
 import os
-import json
 import sys
+import orjson
 from pymongo import MongoClient
 from dotenv import load_dotenv
 
@@ -24,8 +24,8 @@ def store_profile(file_path):
     Reads a JSON file and inserts its content into MongoDB.
     """
     try:
-        with open(file_path, "r") as f:
-            data = json.load(f)
+        with open(file_path, "rb") as f:
+            data = orjson.loads(f.read())
         # add approved flag
         collection.insert_one({**data, "approved": False})
         print(f"Inserted {os.path.basename(file_path)} into MongoDB with approved=False")
@@ -1,8 +1,15 @@
 from flask import Flask, request, jsonify
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
+import orjson
 from pymongo import MongoClient
 from dotenv import load_dotenv
 import os
+import re
+import time
+import shutil
+import threading
+from pathlib import Path
 from bson.objectid import ObjectId
 
 # Load .env
@@ -19,14 +26,33 @@ client = MongoClient(MONGO_URI)
 db = client[DB_NAME]
 collection = db[COLLECTION_NAME]
 
+class ORJSONProvider(JSONProvider):
+    """JSON provider backed by orjson so jsonify encodes in C."""
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 # Flask app
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 CORS(app)  # enable CORS for all routes
 
-# Set upload folder relative to backend directory
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))  # backend directory
-UPLOAD_FOLDER = os.path.join(BASE_DIR, "..", "agents", "jobdescription", "input")
-os.makedirs(UPLOAD_FOLDER, exist_ok=True)
+# Set upload folder relative to backend directory; resolved once at import.
+BASE_DIR = Path(__file__).resolve().parent  # backend directory
+UPLOAD_DIR = BASE_DIR.parent / "agents" / "jobdescription" / "input"
+UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+
+# Strips anything that could escape the upload directory or confuse the
+# agent's file watcher; compiled once instead of per upload.
+_SAFE_FILENAME_RE = re.compile(r'[^A-Za-z0-9._-]+')
+
+
+def safe_filename(filename):
+    filename = _SAFE_FILENAME_RE.sub('_', os.path.basename(filename))[:200]
+    # "." and ".." survive the regex but aren't writable file names.
+    return "" if filename in {".", ".."} else filename
 
 # ---------------- File Upload Endpoint ----------------
 @app.route("/upload", methods=["POST"])
@@ -39,25 +65,62 @@ def upload_file():
     if file.filename == "":
         return jsonify({"error": "No selected file"}), 400
 
-    filepath = os.path.join(UPLOAD_FOLDER, file.filename)
-    file.save(filepath)
+    filename = safe_filename(file.filename)
+    if not filename:
+        return jsonify({"error": "Invalid filename"}), 400
+
+    # Copy with a 1MB buffer instead of Werkzeug's small default chunks.
+    with open(UPLOAD_DIR / filename, "wb") as out:
+        shutil.copyfileobj(file.stream, out, 1 << 20)
+
+    return jsonify({"message": f"File uploaded successfully: {filename}"}), 200
+
+# ---------------- Profiles List Cache ----------------
+# The dashboard polls /profiles, so the full collection scan is cached.
+# Writes made through this API invalidate it directly; the jobdescription
+# agent also inserts into the collection out-of-process, so entries expire
+# after a short TTL as well.
+PROFILES_CACHE_TTL = 5.0
+_profiles_cache = None
+_profiles_cache_time = 0.0
+_profiles_cache_lock = threading.Lock()
 
-    return jsonify({"message": f"File uploaded successfully: {file.filename}"}), 200
+
+def invalidate_profiles_cache():
+    global _profiles_cache
+    with _profiles_cache_lock:
+        _profiles_cache = None
+
+
+def get_profiles_cached():
+    global _profiles_cache, _profiles_cache_time
+    with _profiles_cache_lock:
+        if _profiles_cache is not None and time.monotonic() - _profiles_cache_time < PROFILES_CACHE_TTL:
+            return _profiles_cache
+
+    profiles = []
+    for profile in collection.find({}):
+        profile["_id"] = str(profile["_id"])  # Convert ObjectId to string
+        profiles.append(profile)
+
+    with _profiles_cache_lock:
+        _profiles_cache = profiles
+        _profiles_cache_time = time.monotonic()
+    return profiles
 
 # ---------------- Retrieve Job Profiles ----------------
 @app.route("/profiles", methods=["GET"])
 def get_profiles():
     try:
-        profiles_cursor = collection.find({})
-        profiles = []
-        for profile in profiles_cursor:
-            profile["_id"] = str(profile["_id"])  # Convert ObjectId to string
-            profiles.append(profile)
-        return jsonify({"profiles": profiles}), 200
+        response = jsonify({"profiles": get_profiles_cached()})
+        # ETag over the response body lets polling clients send
+        # If-None-Match and get an empty 304 while nothing has changed.
+        response.add_etag()
+        return response.make_conditional(request)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
-    
-    
+
+
 @app.route("/delete", methods=["POST"])
 def delete_profile():
     data = request.get_json()
@@ -68,6 +131,7 @@ def delete_profile():
         result = collection.delete_one({"_id": ObjectId(profile_id)})
         if result.deleted_count == 0:
             return jsonify({"error": "Profile not found"}), 404
+        invalidate_profiles_cache()
         return jsonify({"message": f'Profile deleted successfully'}), 200
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -83,6 +147,7 @@ def approve_profile():
         result = collection.update_one({"_id": ObjectId(profile_id)}, {"$set": {"approved": True}})
         if result.matched_count == 0:
             return jsonify({"error": "Profile not found"}), 404
+        invalidate_profiles_cache()
         return jsonify({"message": f'Profile approved successfully'}), 200
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -113,10 +178,13 @@ def modify_profile():
         if result.matched_count == 0:
             return jsonify({"error": "Profile not found"}), 404
 
+        invalidate_profiles_cache()
         return jsonify({"message": "Profile modified successfully"}), 200
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 # ---------------- Run App ----------------
 if __name__ == "__main__":
-    app.run(port=8080, debug=True)
+    # Debug middleware and the reloader's per-request stat sweep are opt-in;
+    # production should run through wsgi.py instead.
+    app.run(port=8080, debug=os.environ.get("FLASK_DEBUG") == "1", use_reloader=False)
@@ -0,0 +1,11 @@
+"""
+WSGI entry point so the API can run under a production server instead of
+the single-threaded Werkzeug dev server, e.g. from this directory:
+
+    gunicorn -w 4 -k gevent wsgi:app --timeout 120
+
+or, without extra worker classes:
+
+    waitress-serve --port=8080 wsgi:app
+"""
+from upload_api import app  # noqa: F401